@@ -58,6 +58,7 @@ class ExtractorResult:
         self.extractor = extractor
         self.features = features
         self._history = None
+        self._np_data = None
         self.onset = onsets
         self.duration = durations
         self.order = orders
@@ -73,6 +74,16 @@ class ExtractorResult:
         ''' Creates a DataFrame with default arguments '''
         return self.to_df()
 
+    def as_numpy(self):
+        ''' Returns the raw feature data as a numpy array, converting any
+        framework-native tensors (e.g., tf.Tensor) still held in the
+        result. The conversion is memoized, so extractors that keep
+        outputs on an accelerator device pay the device-to-host copy at
+        most once. '''
+        if self._np_data is None:
+            self._np_data = np.asarray(self._data)
+        return self._np_data
+
     def to_df(self, timing=True, metadata=False, format='wide',
               extractor_name=False, object_id=True, extractor_params=False,
               **to_df_kwargs):
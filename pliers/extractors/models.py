@@ -1,5 +1,10 @@
 ''' Extractor classes based on pre-trained models. '''
 
+import hashlib
+import os
+import shutil
+import weakref
+
 import numpy as np
 import pandas as pd
 
@@ -9,23 +14,93 @@ from pliers.filters.image import ImageResizingFilter
 from pliers.stimuli import ImageStim, TextStim, AudioStim
 from pliers.stimuli.base import Stim
 from pliers.support.exceptions import MissingDependencyError
+from pliers.transformers import BatchTransformerMixin
 from pliers.utils import (attempt_to_import, verify_dependencies,
                          listify)
 
 import logging
 
+def _tf_supports_persistent_xla_cache():
+    ''' Checks whether the installed TensorFlow (>= 2.12) understands the
+    persistent-cache flag, without importing it. Older versions abort the
+    whole process on unknown TF_XLA_FLAGS entries, so the flag must never
+    reach them. '''
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:  # Python < 3.8
+        return False
+    for dist in ('tensorflow', 'tensorflow-cpu', 'tensorflow-gpu'):
+        try:
+            major, minor = version(dist).split('.')[:2]
+            return (int(major), int(minor)) >= (2, 12)
+        except PackageNotFoundError:
+            continue
+        except ValueError:
+            return False
+    return False
+
+
+# Persist XLA-compiled programs across processes, so repeated runs of the
+# same model/input shape pay cache-load time rather than full compile time.
+# Must be set before TensorFlow is first imported. Users can override (or
+# disable caching entirely by setting TF_XLA_FLAGS to an empty string) in
+# their environment, e.g. on ephemeral containers without a stable $HOME.
+if _tf_supports_persistent_xla_cache():
+    os.environ.setdefault(
+        'TF_XLA_FLAGS',
+        '--tf_xla_persistent_cache_directory=' +
+        os.path.expanduser('~/.cache/pliers/xla'))
+
 tf = attempt_to_import('tensorflow')
 hub = attempt_to_import('tensorflow_hub')
 attempt_to_import('tensorflow.keras')
 attempt_to_import('tensorflow_text')
 
-
-class TFHubExtractor(Extractor):
-
-    ''' A generic class for Tensorflow Hub extractors 
+if tf is not None:
+    # TF32 tensor cores give ~2x FP32 matmul/conv throughput on Ampere+
+    # GPUs at precision loss well below extraction tolerances; this is a
+    # no-op on hardware without TF32 support
+    tf.config.experimental.enable_tensor_float_32_execution(True)
+
+_SAVED_MODEL_CACHE_DIR = os.path.expanduser('~/.cache/pliers/savedmodels')
+
+# Weak values, so a cached model's (potentially GB-scale) variables live
+# only as long as some extractor still holds the layer — important in
+# long-lived processes like notebooks and servers
+_HUB_LAYER_CACHE = weakref.WeakValueDictionary()
+
+
+def _get_hub_layer(url_or_path, **kwargs):
+    ''' Returns a process-wide shared hub.KerasLayer for the given model,
+    loading it only on first request. Multiple extractor instances
+    pointing at the same model reuse one layer (and its variables)
+    instead of re-parsing the SavedModel per instance; once the last
+    extractor referencing a layer is garbage-collected, the cache entry
+    goes with it. The active Keras dtype policy is part of the cache key,
+    since layers capture the policy in effect at construction. '''
+    try:
+        key = (url_or_path, tf.keras.mixed_precision.global_policy().name,
+               tuple(sorted(kwargs.items())))
+        hash(key)
+    except TypeError:
+        # Unhashable kwargs (e.g. dict-valued); fall back to a fresh load
+        return hub.KerasLayer(url_or_path, **kwargs)
+    layer = _HUB_LAYER_CACHE.get(key)
+    if layer is None:
+        layer = hub.KerasLayer(url_or_path, **kwargs)
+        _HUB_LAYER_CACHE[key] = layer
+    return layer
+
+
+class TFHubExtractor(BatchTransformerMixin, Extractor):
+
+    ''' A generic class for Tensorflow Hub extractors
     Args:
         url_or_path (str): url or path to TFHub model. You can
             browse models at https://tfhub.dev/.
+        batch_size (int): number of stims to process in each model call.
+            Stims with matching input shapes are stacked and run through
+            the model as a single batch.
         features (optional): list of feature names matching output dimensions
             
             For example, for a classification model with 1000 output classes 
@@ -55,31 +130,84 @@ class TFHubExtractor(Extractor):
             dictionary. Set to None if the output is not a dictionary, 
             or to output all keys in dictionary.
         keras_kwargs (dict): arguments to hub.KerasLayer call
+        mixed_precision (bool): if True, builds the model under the
+            mixed_float16 Keras policy, running most layers in FP16 (with
+            FP32 accumulation) for higher throughput on supporting GPUs.
+        keep_on_device (bool): if True, model outputs are stored in the
+            ExtractorResult as tf.Tensors rather than eagerly copied back
+            to host memory. The copy is deferred until the data is
+            materialized (e.g., via to_df() or ExtractorResult.as_numpy()),
+            which avoids a device-to-host roundtrip per stim when results
+            feed into further on-device computation.
     '''
 
-    _log_attributes = ('url_or_path', 'features', 'transform_out', 'keras_kwargs')
+    _log_attributes = ('url_or_path', 'features', 'transform_out',
+                       'keras_kwargs', 'mixed_precision')
     _input_type = Stim
 
+    # Whether to compile the forward pass with XLA. Off by default: the
+    # generic extractor accepts arbitrary stims, whose inputs may use ops
+    # XLA can't handle (string tensors) or vary in shape call-to-call,
+    # forcing a recompile per shape. Subclasses with fixed-shape inputs
+    # (images) opt in.
+    _jit_compile = False
+    _batch_size = 8
+
     def __init__(self, url_or_path, features=None,
                  transform_out=None, transform_inp=None,
-                 output_key=None, keras_kwargs=None):
+                 output_key=None, keras_kwargs=None,
+                 batch_size=None, mixed_precision=False,
+                 keep_on_device=False):
         verify_dependencies(['tensorflow_hub'])
         if keras_kwargs is None:
             keras_kwargs = {}
         self.keras_kwargs = keras_kwargs
         self.output_key = output_key
-        self.model = hub.KerasLayer(url_or_path, **keras_kwargs)
+        self.mixed_precision = mixed_precision
+        self.keep_on_device = keep_on_device
+        # Subclasses may populate _saved_module from the compiled-model
+        # cache before calling up, in which case the Hub SavedModel parse
+        # is skipped entirely
+        self._saved_module = getattr(self, '_saved_module', None)
+        if mixed_precision:
+            # Layers capture the policy active at construction, so only
+            # the scope of the build needs the mixed_float16 policy
+            fp32_policy = tf.keras.mixed_precision.global_policy()
+            tf.keras.mixed_precision.set_global_policy('mixed_float16')
+        try:
+            if self._saved_module is not None:
+                self.model = self._saved_module.model
+            else:
+                self.model = _get_hub_layer(url_or_path, **keras_kwargs)
+        finally:
+            if mixed_precision:
+                tf.keras.mixed_precision.set_global_policy(fp32_policy)
+        # Where the subclass opts into XLA, wrap the forward pass in a
+        # tf.function built once per instance, so repeated calls with
+        # same-shaped inputs reuse the compiled graph. Otherwise call the
+        # layer eagerly: a plain tf.function would retrace for every
+        # distinct input shape or string value.
+        if self._saved_module is not None:
+            self._call_fn = self._saved_module.call
+        elif self._jit_compile:
+            self._call_fn = tf.function(lambda x: self.model(x),
+                                        jit_compile=True)
+        else:
+            self._call_fn = self.model
 
         self.url_or_path = url_or_path
         self.features = features
+        # Explicit feature names are fixed at construction, so listify
+        # them once rather than on every extraction
+        self._feature_names = listify(features) if features else None
         self.transform_out = transform_out
         self.transform_inp = transform_inp
-        super().__init__()
+        super().__init__(batch_size=batch_size)
 
     def get_feature_names(self, out):
         # Manual feature names always take precedence
-        if self.features:
-            return listify(self.features)
+        if self._feature_names is not None:
+            return self._feature_names
         # Infer feature names from output
         else:
             # If dict, use provided output key, or all keys
@@ -117,12 +245,22 @@ class TFHubExtractor(Extractor):
 
         # If output is a dict and no output key, return all keys
         if isinstance(out, dict):
-            out = np.vstack(list(out.values())).T
-        elif isinstance(out, tf.Tensor):
+            if self.keep_on_device:
+                # Mirror np.vstack semantics: rank-1 values get a leading
+                # batch axis before rows are concatenated along axis 0
+                vals = [v if v.shape.rank > 1 else v[tf.newaxis]
+                        for v in out.values()]
+                out = tf.transpose(tf.concat(vals, axis=0))
+            else:
+                out = np.vstack(list(out.values())).T
+        elif isinstance(out, tf.Tensor) and not self.keep_on_device:
             out = out.numpy()
-        
+
         # Always squeeze last dimension if it is 1
-        out = out.squeeze()
+        if self.keep_on_device:
+            out = tf.squeeze(out)
+        else:
+            out = out.squeeze()
 
         if self.transform_out:
             out = self.transform_out(out)
@@ -141,26 +279,86 @@ class TFHubExtractor(Extractor):
         """
 
         return stim.onset, stim.duration, None
-        
-    def _extract(self, stim):
-        inp = self._preprocess(stim)
-        out = self.model(inp)
-        features = self.get_feature_names(out)
-        out = self._postprocess(out)
-                
-        onsets, durations, orders = self._get_timing(out, stim)
-
-        return ExtractorResult(listify(out), stim, self, 
-                               onsets=onsets, durations=durations,
-                               features=features, orders=orders)
-    
+
+    def _saved_call_path(self, url_or_path, input_spec, keras_kwargs=None,
+                         mixed_precision=False):
+        ''' Location of the on-disk cache entry for this model's traced
+        call. Everything that changes the built model must feed into the
+        key — keras_kwargs (e.g. signature selection) and the precision
+        policy included — or entries built under different options would
+        silently serve each other's outputs. '''
+        key = hashlib.md5(
+            str((url_or_path, tuple(input_spec.shape),
+                 input_spec.dtype.name, self._jit_compile,
+                 sorted((keras_kwargs or {}).items()),
+                 mixed_precision)).encode()
+        ).hexdigest()
+        return os.path.join(_SAVED_MODEL_CACHE_DIR, key)
+
+    def _save_call_fn(self, input_spec, path):
+        ''' Traces the model call at a fixed input signature, persists it
+        as a SavedModel, and installs the traced function as
+        self._call_fn. The artifact is written to a temp directory and
+        renamed into place, so an interrupted save can't leave a partial
+        entry that later loads would mistake for a valid one. '''
+        module = tf.Module()
+        module.model = self.model
+        module.call = tf.function(lambda x: module.model(x),
+                                  jit_compile=self._jit_compile,
+                                  input_signature=[input_spec])
+        # Force tracing so the saved artifact contains the concrete
+        # function
+        module.call.get_concrete_function()
+        tmp = '{}.tmp-{}'.format(path, os.getpid())
+        tf.saved_model.save(module, tmp)
+        try:
+            os.replace(tmp, path)
+        except OSError:
+            # Another process finished first; keep its entry
+            shutil.rmtree(tmp, ignore_errors=True)
+        self._saved_module = module
+        self._call_fn = module.call
+
+    @staticmethod
+    def _slice_output(out, start, stop):
+        # Slices a batched model output back into a per-stim output,
+        # preserving the batch dimension
+        if isinstance(out, dict):
+            return {k: v[start:stop] for k, v in out.items()}
+        return out[start:stop]
+
+    def _get_model_output(self, inps):
+        ''' Runs the model over an iterable of preprocessed inputs and
+        returns one output per input. The default implementation calls the
+        model once per input; subclasses override this to stack compatible
+        inputs into batched calls. '''
+        return [self._call_fn(inp) for inp in inps]
+
+    def _extract(self, stims):
+        # Preprocessing is passed as a lazy generator so subclasses that
+        # stream inputs through tf.data can overlap it with model compute
+        outs = self._get_model_output(self._preprocess(s) for s in stims)
+        results = []
+        for stim, out in zip(stims, outs):
+            features = self.get_feature_names(out)
+            out = self._postprocess(out)
+            onsets, durations, orders = self._get_timing(out, stim)
+            results.append(
+                ExtractorResult(listify(out), stim, self,
+                                onsets=onsets, durations=durations,
+                                features=features, orders=orders))
+        return results
+
+
     def _to_df(self, result):
+        # Materialize any on-device tensors through the result's memoized
+        # accessor, so keep_on_device pays the device-to-host copy here
+        # (at most once) and the DataFrame never holds live tensors
+        data = result.as_numpy()
         if len(result.features) == 1:
-            data = [result._data]
-        else:
-            data = np.array(result._data)
-            if len(data.shape) > 2:
-                data = data.squeeze()
+            data = [[d] for d in data]
+        elif len(data.shape) > 2:
+            data = data.squeeze()
         res_df = pd.DataFrame(data, columns=result.features)
         return res_df
 
@@ -171,29 +369,160 @@ class TFHubImageExtractor(TFHubExtractor):
 
     Note that some models may require specific input shapes.'
     You can reshape inputs using filters, such as ImageResizingFilter.
-    ImageRescaleFilter.
+    ImageRescaleFilter, or by passing reshape_input / rescale_rgb here.
 
     Args:
         url_or_path (str): url or path to TFHub model
-        input_dtype (optional): dtype of input data. Defaults to tf.float32
+        input_dtype (optional): dtype of input data. Defaults to tf.float32.
+            Models that accept half-precision input can be fed
+            tf.float16, which halves host-to-device transfer and enables
+            FP16 tensor-core throughput at accuracy costs well within
+            typical extraction tolerances.
+        reshape_input (tuple): requested input shape (height, width,
+            n_channels). If passed, images are resized to this shape
+            before extraction.
+        rescale_rgb (bool): if True, rescales pixel values to the [0, 1]
+            range expected by most TFHub image models.
+        jit_compile (bool): whether to compile the model call with XLA.
+            On by default, which suits fixed-shape classification and
+            encoding models; set to False for models with ops XLA can't
+            compile (e.g. detection heads with NMS) or for mixed-size
+            image collections without reshape_input, where XLA would
+            recompile for every distinct image size.
+        cache_compiled_model (bool): if True (and reshape_input is set),
+            persists the traced model call as a SavedModel under
+            ~/.cache/pliers/savedmodels, so later processes instantiating
+            the same model and input shape skip the Hub SavedModel parse
+            and function re-trace. Off by default since the cache stores
+            a full copy of the model on disk.
     '''
 
     _input_type = ImageStim
 
-    def __init__(self, 
-                 url_or_path, 
+    # Preprocessing options change the extracted values, so they must
+    # feed into the transformer hash used for result caching
+    _log_attributes = ('url_or_path', 'features', 'transform_out',
+                       'keras_kwargs', 'mixed_precision', 'input_dtype',
+                       'reshape_input', 'rescale_rgb')
+
+    # Image inputs are fixed-shape (or nearly so), the case XLA handles
+    # best
+    _jit_compile = True
+
+    # Take several model batches' worth of stims per _extract call, so the
+    # prefetched tf.data pipeline used when reshape_input is set has
+    # successive minibatches to overlap preprocessing with model compute
+    _batch_size = 32
+    _model_batch_size = 8
+
+    def __init__(self,
+                 url_or_path,
                  input_dtype=None,
+                 reshape_input=None,
+                 rescale_rgb=False,
+                 jit_compile=True,
+                 cache_compiled_model=False,
                  **kwargs):
-        
+
+        # Instance-level override of the class default; see docstring
+        self._jit_compile = jit_compile
         self.input_dtype = input_dtype if input_dtype else tf.float32
+        if rescale_rgb and not self.input_dtype.is_floating:
+            # The [0, 1] range (and the reciprocal scale below) can't be
+            # represented in an integer dtype, so this combination would
+            # silently zero every image
+            raise ValueError(
+                "rescale_rgb=True requires a floating-point input_dtype, "
+                "but got '{}'.".format(self.input_dtype.name))
+        self.reshape_input = reshape_input
+        self.rescale_rgb = rescale_rgb
+        self._np_dtype = np.dtype(self.input_dtype.as_numpy_dtype)
+        self._scale = self._np_dtype.type(1.0 / 255.0)
+        self._resizer = ImageResizingFilter(size=reshape_input[:-1]) \
+            if reshape_input else None
+
+        # Consult the on-disk compiled-model cache before the parent
+        # builds the hub layer, so a hit skips the Hub SavedModel parse
+        if cache_compiled_model and reshape_input:
+            spec = tf.TensorSpec((None,) + tuple(reshape_input),
+                                 self.input_dtype)
+            path = self._saved_call_path(
+                url_or_path, spec,
+                keras_kwargs=kwargs.get('keras_kwargs'),
+                mixed_precision=kwargs.get('mixed_precision', False))
+            if os.path.isdir(path):
+                self._saved_module = tf.saved_model.load(path)
 
         super().__init__(url_or_path, **kwargs)
 
+        # Reusable batch buffer for the stacked path, allocated lazily
+        # from the first uniform batch so streaming workloads (e.g. video
+        # frames) don't allocate a fresh (N, H, W, C) array per batch.
+        # tf.constant copies out of it, so reuse across calls is safe.
+        self._batch_buf = None
+
+        if self.reshape_input:
+            if cache_compiled_model and self._saved_module is None:
+                self._save_call_fn(spec, path)
+            # With a fixed input shape, warm up the compiled call so the
+            # first real stim doesn't pay tracing/compile latency
+            self._call_fn(tf.zeros((1,) + tuple(self.reshape_input),
+                                   dtype=self.input_dtype))
+
     def _preprocess(self, stim):
-        x = tf.convert_to_tensor(stim.data, dtype=self.input_dtype)
-        x = tf.expand_dims(x, axis=0)
+        # Cast, rescale and stack all run in numpy; TF first sees the data
+        # as a single ready-made array, avoiding per-image eager op
+        # dispatch for conversion/expand_dims
+        x = stim.data
+        if self.reshape_input and x.shape != tuple(self.reshape_input):
+            # Resize while the array is still uint8, so the cast and
+            # rescale below only touch the downsampled pixels
+            x = self._resizer.transform(stim).data
+        x = np.ascontiguousarray(x, dtype=self._np_dtype)
+        if self.rescale_rgb:
+            # Multiply by the precomputed reciprocal in place: no division,
+            # no float64 promotion, and no extra full-size temporary
+            if x is stim.data:
+                x = x.copy()
+            np.multiply(x, self._scale, out=x)
         return x
 
+    def _get_model_output(self, inps):
+        if self.reshape_input:
+            # With a fixed input shape, stream the lazily-preprocessed
+            # images through a prefetched tf.data pipeline: CPU
+            # preprocessing of upcoming minibatches overlaps with the
+            # model call on the current one
+            sig = tf.TensorSpec(tuple(self.reshape_input), self.input_dtype)
+            ds = tf.data.Dataset.from_generator(
+                lambda: inps, output_signature=sig)
+            ds = ds.batch(self._model_batch_size) \
+                   .prefetch(tf.data.AUTOTUNE)
+            outs = []
+            for batch in ds:
+                out = self._call_fn(batch)
+                outs.extend(self._slice_output(out, i, i + 1)
+                            for i in range(int(batch.shape[0])))
+            return outs
+
+        inps = list(inps)
+        shapes = set(inp.shape for inp in inps)
+        if len(shapes) == 1:
+            n = len(inps)
+            first = inps[0]
+            if self._batch_buf is None or \
+                    self._batch_buf.shape[1:] != first.shape or \
+                    self._batch_buf.dtype != first.dtype or \
+                    self._batch_buf.shape[0] < n:
+                self._batch_buf = np.empty(
+                    (max(n, self._batch_size),) + first.shape, first.dtype)
+            for i, inp in enumerate(inps):
+                self._batch_buf[i] = inp
+            out = self._call_fn(tf.constant(self._batch_buf[:n]))
+            return [self._slice_output(out, i, i + 1) for i in range(n)]
+        # Heterogeneous shapes can't be stacked; call the model per image
+        return [self._call_fn(tf.constant(inp[None, ...])) for inp in inps]
+
 class TFHubAudioExtractor(TFHubExtractor):
 
     ''' TFHub Extractor class for audio models.
@@ -208,8 +537,11 @@ class TFHubAudioExtractor(TFHubExtractor):
 
     _input_type = AudioStim
 
-    def __init__(self, 
-                 url_or_path, 
+    _log_attributes = ('url_or_path', 'features', 'transform_out',
+                       'keras_kwargs', 'mixed_precision', 'input_dtype')
+
+    def __init__(self,
+                 url_or_path,
                  input_dtype=None,
                  **kwargs):
         
@@ -285,7 +617,7 @@ class TFHubTextExtractor(TFHubExtractor):
             for preprocessor model hub.KerasLayer call
     '''
 
-    _input_type = TextStim 
+    _input_type = TextStim
 
     def __init__(self,
                  url_or_path, 
@@ -301,6 +633,14 @@ class TFHubTextExtractor(TFHubExtractor):
         self.output_key = output_key
         self.preprocessor_url_or_path = preprocessor_url_or_path
         self.preprocessor_kwargs = preprocessor_kwargs if preprocessor_kwargs else {}
+        # Load the preprocessing model once and trace it with tf.function,
+        # rather than re-parsing the SavedModel on every extraction.
+        # jit_compile is not used here since preprocessors operate on
+        # string tensors, which XLA does not support.
+        self._preprocessor = tf.function(
+            _get_hub_layer(self.preprocessor_url_or_path,
+                           **self.preprocessor_kwargs)) \
+            if self.preprocessor_url_or_path else None
         try:
             verify_dependencies(['tensorflow_text'])
         except MissingDependencyError:
@@ -310,15 +650,32 @@ class TFHubTextExtractor(TFHubExtractor):
                             ' Missing dependency errors may arise.')
 
     def _preprocess(self, stim):
-        x = listify(stim.data)
-        if self.preprocessor_url_or_path:
-            preprocessor = hub.KerasLayer(
-                self.preprocessor_url_or_path, **self.preprocessor_kwargs)
-            x = preprocessor(x)
-        return x
-
-
-class TensorFlowKerasApplicationExtractor(ImageExtractor):
+        return listify(stim.data)
+
+    def _get_model_output(self, inps):
+        # Each preprocessed input is a list of strings; concatenate them,
+        # run preprocessing and the model once over the full batch, then
+        # slice outputs back out per stim
+        inps = list(inps)
+        counts = [len(inp) for inp in inps]
+        # Convert to a string tensor before hitting any tf.function:
+        # Python strings act as trace-cache keys, so passing the raw list
+        # would retrace the preprocessor for every distinct input text,
+        # whereas a tensor only retraces per distinct batch length
+        flat = tf.constant([t for inp in inps for t in inp])
+        if self._preprocessor is not None:
+            flat = self._preprocessor(flat)
+        out = self._call_fn(flat)
+        outs = []
+        start = 0
+        for n in counts:
+            outs.append(self._slice_output(out, start, start + n))
+            start += n
+        return outs
+
+
+class TensorFlowKerasApplicationExtractor(BatchTransformerMixin,
+                                          ImageExtractor):
 
     ''' Labels objects in images using a pretrained Inception V3 architecture
     implemented in TensorFlow / Keras.
@@ -336,18 +693,27 @@ class TensorFlowKerasApplicationExtractor(ImageExtractor):
             Applications.
         num_predictions (int): Number of top predicted labels to retain for
             each image.
+        batch_size (int): Number of images to run through the model in a
+            single call.
+        mixed_precision (bool): if True, builds the model under the
+            mixed_float16 Keras policy, running most layers in FP16 (with
+            FP32 accumulation) for higher throughput on supporting GPUs.
      '''
 
-    _log_attributes = ('architecture', 'weights', 'num_predictions')
+    _log_attributes = ('architecture', 'weights', 'num_predictions',
+                       'mixed_precision')
+    _batch_size = 8
     VERSION = '1.0'
 
     def __init__(self,
                  architecture='inceptionv3',
                  weights=None,
-                 num_predictions=5):
+                 num_predictions=5,
+                 batch_size=None,
+                 mixed_precision=False):
         verify_dependencies(['tensorflow'])
         verify_dependencies(['tensorflow.keras'])
-        super().__init__()
+        super().__init__(batch_size=batch_size)
 
         # Model name: (model module, model function, required shape).
         apps = tf.keras.applications
@@ -383,26 +749,54 @@ class TensorFlowKerasApplicationExtractor(ImageExtractor):
         self.architecture = architecture.lower()
         self.weights = weights
         self.num_predictions = num_predictions
+        self.mixed_precision = mixed_precision
 
         # The preprocessing and decoding functions are in the module.
         self._model_module = model_mapping[self.architecture][0]
-        # Instantiating the model also downloads the weights to a cache.
-        self.model = model_mapping[self.architecture][1](weights=self.weights)
+        if mixed_precision:
+            # Layers capture the policy active at construction, so only
+            # the scope of the build needs the mixed_float16 policy
+            fp32_policy = tf.keras.mixed_precision.global_policy()
+            tf.keras.mixed_precision.set_global_policy('mixed_float16')
+        try:
+            # Instantiating the model also downloads the weights to a cache.
+            self.model = \
+                model_mapping[self.architecture][1](weights=self.weights)
+        finally:
+            if mixed_precision:
+                tf.keras.mixed_precision.set_global_policy(fp32_policy)
         self._required_shape = model_mapping[self.architecture][2]
-
-    def _extract(self, stim):
-        x = stim.data
-        if x.ndim != 3:
-            raise ValueError(
-                "Stim data must have rank 3 but got rank {}".format(x.ndim))
-        if x.shape != self._required_shape:
-            resizer = ImageResizingFilter(size=self._required_shape[:-1])
-            x = resizer.transform(stim).data
-        # Add batch dimension.
-        x = x[None]
-        # Normalize the features.
-        x = self._model_module.preprocess_input(x)
-        preds = self.model.predict(x, batch_size=1)
+        self._resizer = ImageResizingFilter(size=self._required_shape[:-1])
+        # Calling the model directly through a compiled tf.function avoids
+        # the per-call overhead of Keras' predict() machinery (data adapter,
+        # callbacks), which dwarfs compute at batch size 1. preprocess_input
+        # runs inside the same function: images cross to the device as
+        # uint8 (4x fewer bytes than float32) and XLA fuses the
+        # cast/normalize into the first conv. Warm up with a dummy batch so
+        # the first stim doesn't pay tracing/compile time.
+        self._call_fn = tf.function(
+            lambda x: self.model(
+                self._model_module.preprocess_input(tf.cast(x, tf.float32)),
+                training=False),
+            jit_compile=True)
+        self._call_fn(np.zeros((1,) + self._required_shape, np.uint8))
+
+    def _extract(self, stims):
+        batch = []
+        for stim in stims:
+            x = stim.data
+            if x.ndim != 3:
+                raise ValueError(
+                    "Stim data must have rank 3 but got rank {}"
+                    .format(x.ndim))
+            if x.shape != self._required_shape:
+                x = self._resizer.transform(stim).data
+            batch.append(x)
+        # Stack along the batch dimension (np.stack output is contiguous,
+        # so the host-to-device copy is a single memcpy) and run one model
+        # call; normalization happens on-device inside _call_fn.
+        x = np.stack(batch)
+        preds = self._call_fn(tf.convert_to_tensor(x)).numpy()
 
         # This produces a nested list. There is one sub-list per sample in the
         # batch, and each sub-list contains `self.num_predictions` tuples with
@@ -410,9 +804,11 @@ class TensorFlowKerasApplicationExtractor(ImageExtractor):
         decoded = self._model_module.decode_predictions(
             preds, top=self.num_predictions)
 
-        # We assume there is only one sample in the batch.
-        decoded = decoded[0]
-        values = [t[2] for t in decoded]
-        features = [t[1] for t in decoded]
-
-        return ExtractorResult([values], stim, self, features=features)
+        results = []
+        for stim, dec in zip(stims, decoded):
+            # Split the (ID, label, probability) tuples in one pass
+            _, features, values = zip(*dec)
+            results.append(
+                ExtractorResult([list(values)], stim, self,
+                                features=list(features)))
+        return results
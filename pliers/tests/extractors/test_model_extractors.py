@@ -94,6 +94,85 @@ def test_tfhub_image_reshape():
     assert all([len(v) == 1280 for v in df['feature_vector']])
 
 
+def test_tfhub_image_batching():
+    stim = ImageStim(join(IMAGE_DIR, 'apple.jpg'))
+    stim2 = ImageStim(join(IMAGE_DIR, 'obama.jpg'))
+    ext = TFHubImageExtractor(MNET_URL,
+                              features='feature_vector',
+                              reshape_input=(224, 224, 3),
+                              rescale_rgb=True)
+    batched = [r.to_df() for r in ext.transform([stim, stim2, stim])]
+    singles = [ext.transform(s).to_df() for s in [stim, stim2, stim]]
+    # Batched extraction must be stim-for-stim equivalent to one-at-a-time
+    for b, s in zip(batched, singles):
+        assert np.allclose(b['feature_vector'][0],
+                           s['feature_vector'][0], atol=1e-5)
+    # Identical stims at different batch positions must agree
+    assert np.allclose(batched[0]['feature_vector'][0],
+                       batched[2]['feature_vector'][0], atol=1e-5)
+
+
+def test_tfhub_image_preprocess():
+    stim = ImageStim(join(IMAGE_DIR, 'apple.jpg'))
+    ext = TFHubImageExtractor(MNET_URL,
+                              reshape_input=(224, 224, 3),
+                              rescale_rgb=True)
+    x = ext._preprocess(stim)
+    assert x.shape == (224, 224, 3)
+    assert x.dtype == np.float32
+    resized = ImageResizingFilter(size=(224, 224)).transform(stim).data
+    assert np.allclose(x, resized / 255., atol=1e-6)
+    # The in-place rescale must not mutate the stim's own pixel data
+    assert stim.data.dtype == np.uint8
+    # Rescaling to [0, 1] is impossible in an integer dtype
+    with pytest.raises(ValueError) as err:
+        TFHubImageExtractor(MNET_URL, input_dtype=tf.uint8,
+                            rescale_rgb=True)
+    assert 'floating-point' in str(err.value)
+
+
+def test_tfhub_image_preprocessing_in_hash():
+    # Regression test: preprocessing options must feed into the
+    # transformer hash, otherwise result caching conflates differently
+    # configured extractors on the same model
+    ext = TFHubImageExtractor(MNET_URL)
+    ext_conf = TFHubImageExtractor(MNET_URL,
+                                   reshape_input=(224, 224, 3),
+                                   rescale_rgb=True)
+    assert hash(ext) != hash(ext_conf)
+
+
+def test_tfhub_keep_on_device():
+    stim = TextStim(text='a sentence to encode')
+    ext = TFHubTextExtractor(GNEWS_URL, output_key=None,
+                             features='embedding', keep_on_device=True)
+    ext_host = TFHubTextExtractor(GNEWS_URL, output_key=None,
+                                  features='embedding')
+    res = ext.transform(stim)
+    assert isinstance(res._data[0], tf.Tensor)
+    host = ext_host.transform(stim)
+    assert np.allclose(res.as_numpy(), host.as_numpy(), atol=1e-5)
+    # Dict outputs with rank-1 values must match the host-side
+    # np.vstack(...).T layout
+    out = {'pitch': tf.constant([.1, .2, .3]),
+           'uncertainty': tf.constant([.4, .5, .6])}
+    on_dev = ext._postprocess(out)
+    on_host = ext_host._postprocess({k: v.numpy() for k, v in out.items()})
+    assert on_host.shape == (3, 2)
+    assert np.allclose(on_dev.numpy(), on_host)
+
+
+def test_extractor_result_as_numpy():
+    stim = TextStim(text='a sentence to encode')
+    ext = TFHubTextExtractor(GNEWS_URL, output_key=None,
+                             features='embedding')
+    res = ext.transform(stim)
+    arr = res.as_numpy()
+    assert isinstance(arr, np.ndarray)
+    # Conversion is memoized
+    assert res.as_numpy() is arr
+
+
 def test_tfhub_text():
     stim = TextStim(join(TEXT_DIR, 'scandal.txt'))
     ext = TFHubTextExtractor(SENTENC_URL, output_key=None)